@@ -1,22 +1,37 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import messagebox
 import numpy as np
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
 import guilib
 
 # State dictionary to maintain the program state
 state = {
-    "data": (None, None),
+    "data": None,
+    "uniform_dx": None,
     "points": [],
     "canvas": None,
+    "plotted": False,
     "window": None,
     "Messages": None,
     "peaks": [],
-    "callback_id": None
+    "background": None,
+    "blitted_peaks": 0,
+    "callback_id": None,
+    "point_selection": None
 }
 
+# Summed spectrum of a folder is cached here so that re-opening it skips text parsing
+CACHE_FILE_NAME = ".spectral_cache.npy"
+
+# np.trapz was renamed to np.trapezoid in NumPy 2.0 and later removed
+trapezoid = getattr(np, "trapezoid", None) or np.trapz
+
+class NoDataError(Exception):
+    """Raised when an operation needs spectral data that hasn't been loaded or plotted."""
+
 # ===============================
 # Interactive Functions
 # ===============================
@@ -32,6 +47,17 @@ def custom_write_to_textbox(box, content, clear=False):
     box.see(tk.END)
     box.update_idletasks()
     
+def custom_write_many(box, lines, clear=False):
+    """Writes several lines of text into the selected textbox at once, so that the
+    textbox is only scrolled and redrawn a single time.
+    Parameters:
+    - box (tk.Text): The textbox where the lines should be written.
+    - lines (list): The lines to write, each ending with a newline.
+    - clear (bool, optional): If True, clears the textbox before writing. Defaults to False.
+    """
+    if lines:
+        custom_write_to_textbox(box, "".join(lines), clear)
+
 def custom_show_info_message(title, message):
     """Display an information message using a messagebox.
     Parameters:
@@ -52,6 +78,33 @@ def custom_show_error_message(title, message):
 # Core Program Functions
 # ===============================
 
+def require_data(plotted=False):
+    """Returns the loaded spectral data as separate kinetic energy and intensity arrays.
+    The data is stored as a single contiguous (2, N) array, so these are views of its rows.
+    Parameters:
+    - plotted (bool, optional): If True, the data must also have been plotted. Defaults to False.
+    Returns:
+    - tuple: The kinetic energy and intensity arrays.
+    Raises:
+    - NoDataError: If no data is loaded, or it hasn't been plotted when that is required.
+    """
+    data = state["data"]
+    if data is None or (plotted and not state["plotted"]):
+        raise NoDataError("Spectral data has not been loaded and plotted.")
+    return data[0], data[1]
+
+def get_uniform_spacing(x_data):
+    """Returns the sample spacing of the given axis if the samples are evenly spaced.
+    Parameters:
+    - x_data (np.ndarray): The kinetic energy axis.
+    Returns:
+    - float: The spacing between consecutive samples, or None if the spacing is not uniform.
+    """
+    steps = np.diff(x_data)
+    if steps.size and np.allclose(steps, steps[0]):
+        return float(steps[0])
+    return None
+
 def reset_state(*args):
     """Resets the state variables based on provided arguments. 
     If no argument(s) is provided, all state variables are reset.
@@ -60,45 +113,155 @@ def reset_state(*args):
     """
     if not args or "data" in args:
         state["data"] = None
+        state["uniform_dx"] = None
     if not args or "peaks" in args:
         state["peaks"] = []
     if not args or "canvas" in args:
-        if state["canvas"]:
-            state["canvas"].get_tk_widget().destroy()
-            state["canvas"] = None
+        if state["plotted"]:
+            state["canvas"].get_tk_widget().pack_forget()
+            state["plotted"] = False
         
-def read_data(folder_path):
+def read_cache(folder_path, txt_files):
+    """Reads the cached summed spectrum of the given folder if it is up to date.
+    The cache is considered fresh when it is newer than every data file and than
+    the folder itself, so added, modified and removed files all invalidate it.
+    Parameters:
+    - folder_path (str): The path to the folder containing the .txt data files.
+    - txt_files (list): Paths of the .txt data files in the folder.
+    Returns:
+    - np.ndarray: A read-only, memory-mapped (2, N) array of kinetic energy and summed 
+      intensities, or None if there is no fresh cache.
+    """
+    cache_path = os.path.join(folder_path, CACHE_FILE_NAME)
+    try:
+        cache_mtime = os.path.getmtime(cache_path)
+        newest_mtime = max(
+            [os.path.getmtime(folder_path)] + [os.path.getmtime(f) for f in txt_files]
+        )
+        if cache_mtime < newest_mtime:
+            return None
+        # Pages are read on demand; the data is only copied when it is modified
+        cached = np.load(cache_path, mmap_mode="r")
+    except (ValueError, OSError):
+        return None
+    if cached.ndim != 2 or cached.shape[0] != 2:
+        return None
+    return cached
+
+def write_cache(folder_path, spectrum):
+    """Saves the summed spectrum of the given folder for later loads. 
+    Failing to write the cache (e.g. in a read-only folder) is not an error.
+    The cache is replaced rather than overwritten, so a spectrum that is still mapped from
+    the previous cache stays valid.
+    Parameters:
+    - folder_path (str): The path to the folder containing the .txt data files.
+    - spectrum (np.ndarray): A (2, N) array of kinetic energy and summed intensities.
+    """
+    cache_path = os.path.join(folder_path, CACHE_FILE_NAME)
+    temp_path = cache_path + ".tmp"
+    try:
+        with open(temp_path, "wb") as cache_file:
+            np.save(cache_file, spectrum)
+        os.replace(temp_path, cache_path)
+        # Replacing the file touches the folder, so stamp the cache after it
+        os.utime(cache_path)
+    except OSError:
+        # Don't leave a partly written cache behind in the data folder
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+def parse_file(file_path):
+    """Parses the kinetic energy and intensity columns of a single .txt data file.
+    Parameters:
+    - file_path (str): The path to the .txt data file.
+    Returns:
+    - tuple: The kinetic energy and intensity arrays, or None if the file could not be parsed
+      or has no data rows.
+    """
+    try:
+        file_data = np.loadtxt(
+            file_path, dtype=np.float64, usecols=(0, 1), unpack=True, ndmin=2
+        )
+    except (ValueError, OSError, IOError):
+        return None
+    # An empty file must not become the reference that the other files are compared to
+    if file_data.shape[1] == 0:
+        return None
+    return file_data
+
+def list_data_files(folder_path):
+    """Lists the .txt data files of the given folder with a single directory scan.
+    Parameters:
+    - folder_path (str): The path to the folder containing the .txt data files.
+    Returns:
+    - list: Paths of the .txt data files in the folder.
+    """
+    return [
+        entry.path for entry in os.scandir(folder_path)
+        if entry.name.endswith(".txt") and entry.is_file()
+    ]
+
+def read_data(folder_path, txt_files=None):
     """Reads all .txt data files from the given folder, sums up the intensities,
     and reports any faulty files.
     Parameters:
     - folder_path (str): The path to the folder containing the .txt data files.
+    - txt_files (list, optional): Paths of the .txt data files, if the folder was already scanned.
     Returns:
-    - tuple: Contains two arrays; one for kinetic energy and another for summed intensities.
+    - tuple: Contains a (2, N) array whose rows are the ascending kinetic energy and the summed 
+      intensities (or None if no file could be read), the faulty files and the number of 
+      successfully read files.
     """
     kinetic_energy = None
-    total_intensities = None
+    intensity_columns = None
     faulty_files = []
     successful_files = 0
+    if txt_files is None:
+        txt_files = list_data_files(folder_path)
+
+    if txt_files:
+        cached = read_cache(folder_path, txt_files)
+        if cached is not None:
+            return cached, faulty_files, len(txt_files)
     
-    for file_name in os.listdir(folder_path):
-        if file_name.endswith(".txt"):
-            file_path = os.path.join(folder_path, file_name)
-            try:
-                file_data = np.loadtxt(file_path).T
-                if kinetic_energy is None:
-                    kinetic_energy = file_data[0]
-                    total_intensities = np.zeros_like(kinetic_energy)
-                total_intensities += file_data[1]
-                successful_files += 1
-            except (ValueError, OSError, IOError):
-                faulty_files.append(file_name)
-                custom_write_to_textbox(state["messages"], f"Error processing file: {file_name}.\n")
+    # Files are independent of each other, so they are parsed in a thread pool
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        parsed_files = list(executor.map(parse_file, txt_files))
+
+    for file_path, file_data in zip(txt_files, parsed_files):
+        file_name = os.path.basename(file_path)
+        if file_data is not None and kinetic_energy is None:
+            kinetic_energy = file_data[0]
+            # One float64 row per file, filled in place and summed once at the end
+            intensity_columns = np.empty((len(txt_files), kinetic_energy.shape[0]), dtype=np.float64)
+        if file_data is None or file_data[1].shape != kinetic_energy.shape:
+            faulty_files.append(file_name)
+            continue
+        intensity_columns[successful_files] = file_data[1]
+        successful_files += 1
+
+    custom_write_many(
+    state["messages"],
+    [f"Error processing file: {file_name}.\n" for file_name in faulty_files]
+    )
     
     if successful_files == 0:
         custom_write_to_textbox(state["messages"], "No valid data found in the selected folder.\n")
-        return None, None, faulty_files, successful_files
+        return None, faulty_files, successful_files
+
+    spectrum = np.empty((2, kinetic_energy.shape[0]), dtype=np.float64)
+    spectrum[0] = kinetic_energy
+    np.add.reduce(intensity_columns[:successful_files], axis=0, out=spectrum[1])
+    if spectrum[0, 0] > spectrum[0, -1]:
+        spectrum = np.ascontiguousarray(spectrum[:, ::-1])
+
+    # Only a folder without faulty files is cached, so a cache hit means all files are valid
+    if not faulty_files:
+        write_cache(folder_path, spectrum)
     
-    return kinetic_energy, total_intensities, faulty_files, successful_files
+    return spectrum, faulty_files, successful_files
 
 def load_data():
     """Loads spectral data from a user-selected folder and updates the program state.
@@ -117,27 +280,33 @@ def load_data():
             state["messages"],
             f"\n{folder_name} contains the following files:\n"
             )
-            for file_name in os.listdir(folder_path):
-                custom_write_to_textbox(state["messages"], f"  - {file_name}\n")  
+            entries = [entry for entry in os.scandir(folder_path) if entry.name != CACHE_FILE_NAME]
+            custom_write_many(state["messages"], [f"  - {entry.name}\n" for entry in entries])
         else:
             custom_show_error_message("Error", "Selected folder does not exist. Check again.") 
             return
-        x_data, y_data, faulty_files, successful_files = read_data(folder_path)
-
-        if x_data is not None and y_data is not None and successful_files > 0:
-            state["data"] = (x_data, y_data)
-            state["peaks"] = []
-            if state["canvas"]:
-                state["canvas"].get_tk_widget().destroy()
-                state["canvas"] = None
+        txt_files = [
+            entry.path for entry in entries
+            if entry.name.endswith(".txt") and entry.is_file()
+        ]
+        spectrum, faulty_files, successful_files = read_data(folder_path, txt_files)
+        # Points being selected on the old spectrum don't apply to whatever is loaded now
+        cancel_point_selection()
+
+        if spectrum is not None and successful_files > 0:
+            state["data"] = spectrum
+            state["uniform_dx"] = get_uniform_spacing(state["data"][0])
+            reset_state("peaks", "canvas")
             custom_write_to_textbox(state["messages"], "All valid data loaded successfully!\n")
             if faulty_files:
                 custom_write_to_textbox(
                 state["messages"],
                 "The following files could not be processed:\n"
                 )  
-                for file_name in faulty_files:
-                    custom_write_to_textbox(state["messages"], f"  - {file_name}\n")  
+                custom_write_many(
+                state["messages"],
+                [f"  - {file_name}\n" for file_name in faulty_files]
+                )
         else:
             custom_show_error_message("Error", "Error reading data from the provided folder.")
             reset_state()
@@ -146,33 +315,58 @@ def plot_data():
     """Plots the spectral data loaded into the program state.
     This function retrieves the spectral data from the global state and plots it using Matplotlib. 
     The plot is embedded within the GUI window. If no data is currently loaded,an error message is
-    displayed to the user.
+    displayed to the user. The figure and its canvas are created once in main and redrawn here.
     """
-    if state["data"] is None:
+    try:
+        x_data, y_data = require_data()
+    except NoDataError:
         custom_show_error_message("Error", "Please load data first.\n")
         return
         
-    if state["data"] and len(state["data"]) >= 2:
-        x_data, y_data = state["data"]
-    else:
-        x_data, y_data = [], []
+    cancel_point_selection()
     reset_state("peaks")
-    plt.close('all')
-    fig, axis = plt.subplots()
+    axis = state["canvas"].figure.axes[0]
+    axis.clear()
     axis.plot(x_data, y_data, label='Intensity')
     axis.set_xlabel('Binding Energy (eV)')
     axis.set_ylabel('Intensity (arbitrary units)')
     axis.set_title('Photoionization Spectrum')
     axis.legend()
 
-    if state["canvas"]:
-        state["canvas"].get_tk_widget().destroy()
-    state["canvas"] = FigureCanvasTkAgg(fig,
-    master=state["window"])
-    state["canvas"].draw()
-    state["canvas"].get_tk_widget().pack(side=guilib.TOP, fill=tk.BOTH, expand=1)
+    state["background"] = None
+    state["canvas"].draw_idle()
+    if not state["plotted"]:
+        state["canvas"].get_tk_widget().pack(side=guilib.TOP, fill=tk.BOTH, expand=1)
+        state["plotted"] = True
     custom_write_to_textbox(state["messages"], "Data plotted successfully.\n")
 
+def cache_background(event):
+    """Caches the plot area after every full draw of the canvas, so that peaks added later can be 
+    blitted on top of it. The peaks already on the plot are part of the cached background.
+    Parameters:
+    - event (DrawEvent): The draw event from Matplotlib.
+    """
+    canvas = state["canvas"]
+    state["background"] = canvas.copy_from_bbox(canvas.figure.axes[0].bbox)
+    state["blitted_peaks"] = len(state["peaks"])
+
+def blit_peaks():
+    """Draws the peaks added since the last full draw on top of the cached background and blits
+    the plot area, instead of redrawing the whole figure.
+    """
+    canvas = state["canvas"]
+    if state["background"] is None:
+        canvas.draw_idle()
+        return
+    axis = canvas.figure.axes[0]
+    canvas.restore_region(state["background"])
+    for _, _, peak in state["peaks"][state["blitted_peaks"]:]:
+        axis.draw_artist(peak)
+    for line in axis.get_lines():
+        axis.draw_artist(line)
+    axis.draw_artist(axis.get_legend())
+    canvas.blit(axis.bbox)
+
 def fit_line(point1, point2):
     """Fits a straight line through the given points using least squares regression.
     Parameters:
@@ -186,14 +380,80 @@ def fit_line(point1, point2):
     f"\nThe slope is {slope} and the intercept is {intercept}.")
     return slope, intercept
 
-def get_two_points():
+def subtract_line(x_data, y_data, slope, intercept, out):
+    """Subtracts the line slope * x + intercept from the intensities without temporary arrays.
+    Parameters:
+    - x_data (np.ndarray): The kinetic energy axis.
+    - y_data (np.ndarray): The intensities.
+    - slope (float): The slope of the line.
+    - intercept (float): The intercept of the line.
+    - out (np.ndarray): The array the corrected intensities are written to.
+    Returns:
+    - np.ndarray: The out array.
+    """
+    np.multiply(x_data, slope, out=out)
+    np.add(out, intercept, out=out)
+    return np.subtract(y_data, out, out=out)
+
+def trapz_uniform(y_data, dx):
+    """Integrates evenly spaced intensities with the trapezoidal rule, which on an even 
+    grid reduces to a single sum.
+    Parameters:
+    - y_data (np.ndarray): The intensities.
+    - dx (float): The spacing between consecutive samples.
+    Returns:
+    - float: The integral.
+    """
+    return dx * (y_data.sum() - 0.5 * (y_data[0] + y_data[-1]))
+
+def find_nearest_index(x_data, target):
+    """Finds the sample of an ascending axis that is nearest to the given value.
+    The search is a bisection followed by a comparison of the two neighbouring samples,
+    so no temporary arrays are created.
+    Parameters:
+    - x_data (np.ndarray): The ascending kinetic energy axis.
+    - target (float): The value to look for.
+    Returns:
+    - int: The index of the nearest sample.
+    """
+    index = int(np.searchsorted(x_data, target))
+    if index == len(x_data) or (index > 0 and target - x_data[index - 1] <= x_data[index] - target):
+        return index - 1
+    return index
+
+def cancel_point_selection():
+    """Cancels a point selection that is still waiting for clicks, so that its wait ends and
+    get_two_points returns None. Nothing is done if no selection is in progress.
+    """
+    if state["point_selection"] is not None:
+        state["point_selection"].set(True)
+
+def get_two_points(x_data, y_data, y_max):
     """Initiates the process to let the user select two points on the plot.
     This function prepares the program state for capturing two user-selected points on the plot. 
     It sets up an event listener to detect mouse clicks on the plot, allowing the user to select 
     two points. These points are typically used to fit a linear background or select intervals for
-    calculating intensity.
+    calculating intensity. The selected points are marked on the plot by blitting, so clicks don't
+    trigger a full redraw of the figure.
+    Parameters:
+    - x_data (np.ndarray): The plotted kinetic energy axis.
+    - y_data (np.ndarray): The plotted intensities.
+    - y_max (float): The maximum intensity of the plotted data, used for the click tolerance.
+    Returns:
+    - list: The two selected (x, y) points, or None if the selection was cancelled (the
+      application was closed, data was loaded or plotted, or a new selection was started)
+      before both points were selected.
     """
+    cancel_point_selection()
+
     points = []
+    tolerance = 0.05 * y_max
+    canvas = state["canvas"]
+    axis = canvas.figure.axes[0]
+    background = canvas.copy_from_bbox(axis.bbox)
+    marker, = axis.plot([], [], 'o', color='red', animated=True)
+    selection_done = tk.BooleanVar(master=state["window"], value=False)
+
     def onclick(event):
         if event.xdata is None or event.ydata is None:
             custom_write_to_textbox(
@@ -202,16 +462,8 @@ def get_two_points():
             )
             return
             
-        if state["data"] and len(state["data"]) >= 2:
-            x_data, y_data = state["data"]
-        else:
-            x_data, y_data = [], []
-        nearest_index = np.argmin(np.abs(x_data - event.xdata))
-        if (x_data is not None and y_data is not None and #fixing unsubscriptable possibility
-        isinstance(x_data, (list, np.ndarray)) and
-        isinstance(y_data, (list, np.ndarray))):
-            nearest_point = (x_data[nearest_index], y_data[nearest_index])
-            tolerance = 0.05 * max(y_data)
+        nearest_index = find_nearest_index(x_data, event.xdata)
+        nearest_point = (x_data[nearest_index], y_data[nearest_index])
       
         if abs(nearest_point[1] - event.ydata) > tolerance:
             custom_write_to_textbox(
@@ -223,18 +475,29 @@ def get_two_points():
         if not points or (points and points[-1] != nearest_point):
             points.append(nearest_point)
             custom_write_to_textbox(state["messages"], f"\nYou selected: {nearest_point}")
+            canvas.restore_region(background)
+            marker.set_data([point[0] for point in points], [point[1] for point in points])
+            axis.draw_artist(marker)
+            canvas.blit(axis.bbox)
         
         if len(points) == 2:
-            state["canvas"].mpl_disconnect(state["callback_id"])
+            canvas.mpl_disconnect(state["callback_id"])
+            selection_done.set(True)
 
     if state["callback_id"]:
-        state["canvas"].mpl_disconnect(state["callback_id"])
+        canvas.mpl_disconnect(state["callback_id"])
         
-    state["callback_id"] = state["canvas"].mpl_connect('button_press_event', onclick)
+    state["callback_id"] = canvas.mpl_connect('button_press_event', onclick)
+    state["point_selection"] = selection_done
     
-    while len(points) < 2:
-        state["window"].update_idletasks()
-        state["window"].update()
+    # Let Tk sleep until both points are selected instead of polling the event loop
+    state["window"].wait_variable(selection_done)
+    state["point_selection"] = None
+    # Replotting during the selection clears the axis, which already detaches the marker
+    if marker.axes is not None:
+        marker.remove()
+    if len(points) < 2:
+        return None
     return points
 
 def remove_background():
@@ -242,26 +505,33 @@ def remove_background():
     This function prompts the user to select two points on the plot to fit a linear background.
     The background is then subtracted from the loaded data to provide a baseline-corrected spectrum.
     """
-    if state["data"] is None or state["canvas"] is None:
+    try:
+        x_data, y_data = require_data(plotted=True)
+    except NoDataError:
         custom_show_error_message("Error", "Please load and plot data first.\n")
         return
         
     reset_state("peaks")
     custom_write_to_textbox(state["messages"],
     "Please select two points on the plot for background removal.\n")
-    points = get_two_points()
+    points = get_two_points(x_data, y_data, float(np.max(y_data)))
+    if points is None:
+        return
     
     if len(points) != 2:
         custom_show_error_message("Error", "Failed to select two points. Please try again.\n")
         return
+    # The event loop ran during the selection, so the data is read again in case it changed
+    try:
+        x_data, y_data = require_data(plotted=True)
+    except NoDataError:
+        return
         
     slope, intercept = fit_line(points[0], points[1])
-    if state["data"] and len(state["data"]) >= 2:
-        x_data, y_data = state["data"]
-    else:
-        x_data, y_data = [], []
-    y_corrected = y_data - (slope * x_data + intercept)
-    state["data"] = (x_data, y_corrected)
+    corrected = np.empty((2, x_data.shape[0]), dtype=np.float64)
+    corrected[0] = x_data
+    subtract_line(x_data, y_data, slope, intercept, out=corrected[1])
+    state["data"] = corrected
     plot_data()
     custom_show_info_message("Info", "Linear background removed successfully.\n")
 
@@ -270,30 +540,34 @@ def calculate_intensity():
     This function computes the intensity of the loaded spectral data based on the current state. 
     Results and any relevant messages are displayed in the messages box.
     """
-    if state["data"] is None or state["canvas"] is None:
+    try:
+        x_data, y_data = require_data(plotted=True)
+    except NoDataError:
         custom_show_error_message("Error", "Please load and plot data first.\n")
         return
     custom_write_to_textbox(
     state["messages"],
     "Please select the interval on the plot to calculate intensity.\n"
     )
-    points = get_two_points()
+    points = get_two_points(x_data, y_data, float(np.max(y_data)))
+    if points is None:
+        return
     if len(points) != 2:
         custom_show_error_message("Error", "Failed to select an interval. Please try again.\n")
         return
+    # The event loop ran during the selection, so the data is read again in case it changed
+    try:
+        x_data, y_data = require_data(plotted=True)
+    except NoDataError:
+        return
         
-    if state["data"] and len(state["data"]) >= 2:
-        x_data, y_data = state["data"]
-    else:
-        x_data, y_data = [], []
-    if (x_data is not None and y_data is not None and #fixing unsubscriptable possibility
-        isinstance(x_data, (list, np.ndarray)) and
-        isinstance(y_data, (list, np.ndarray))):
-        lower_bound = min(points[0][0], points[1][0])
-        upper_bound = max(points[0][0], points[1][0])
-        mask = (x_data >= lower_bound) & (x_data <= upper_bound)
-        x_interval = x_data[mask]
-        y_interval = y_data[mask]
+    first_x, second_x = points[0][0], points[1][0]
+    lower_bound, upper_bound = (first_x, second_x) if first_x < second_x else (second_x, first_x)
+    # The energy axis is ascending, so the interval is a contiguous slice
+    lower_index = np.searchsorted(x_data, lower_bound, side='left')
+    upper_index = np.searchsorted(x_data, upper_bound, side='right')
+    x_interval = x_data[lower_index:upper_index]
+    y_interval = y_data[lower_index:upper_index]
 
     if len(x_interval) == 0 or len(y_interval) == 0:
         custom_show_info_message(
@@ -302,26 +576,23 @@ def calculate_intensity():
         )
         return
 
-    intensity = np.trapz(y_interval, x_interval)
+    if state["uniform_dx"] is not None:
+        intensity = trapz_uniform(y_interval, state["uniform_dx"])
+    else:
+        intensity = trapezoid(y_interval, x_interval)
     custom_write_to_textbox(state["messages"], f"Calculated Intensity: {intensity:.2f}\n")
-    state["peaks"].append((x_interval, y_interval))
     
-    fig, axis = plt.gcf(), plt.gca()
-    axis.clear()
-    axis.plot(x_data, y_data, label='Intensity')  
-    for x_int, y_int in state["peaks"]:
-        axis.fill_between(x_int, y_int, color='yellow', alpha=0.5)
-    axis.set_xlabel('Binding Energy (eV)')
-    axis.set_ylabel('Intensity (arbitrary units)')
-    axis.set_title('Photoionization Spectrum')
-    axis.legend(['Intensity', 'Peaks'], loc="upper right")
-    fig.canvas.draw()
-
-    if state["canvas"]:
-        state["canvas"].get_tk_widget().destroy()
-    state["canvas"] = FigureCanvasTkAgg(fig, master=state["window"])
-    state["canvas"].draw()
-    state["canvas"].get_tk_widget().pack(side=guilib.TOP, fill=tk.BOTH, expand=1)
+    # Only the new peak is added to the existing plot instead of rebuilding the figure
+    axis = state["canvas"].figure.axes[0]
+    peak = axis.fill_between(x_interval, y_interval, color='yellow', alpha=0.5)
+    state["peaks"].append((x_interval, y_interval, peak))
+    if len(state["peaks"]) == 1:
+        # The legend changes with the first peak, so that one needs a full redraw
+        peak.set_label('Peaks')
+        axis.legend(loc="upper right")
+        state["canvas"].draw_idle()
+    else:
+        blit_peaks()
     custom_show_info_message("Info", "Intensity calculated and highlighted successfully.\n")
 
 def save_figure():
@@ -329,7 +600,9 @@ def save_figure():
     This function prompts the user to select a location and filename to save the current plot.
     The plot is then saved to the specified file in a suitable format(default is png).
     """
-    if state["data"] is None:
+    try:
+        require_data(plotted=True)
+    except NoDataError:
         custom_show_error_message("Error", "Please load and plot data first.\n")
         return
         
@@ -350,8 +623,8 @@ def close_app():
     performed before the application is closed. It then terminates the GUI event loop 
     and closes the application window.
     """
+    cancel_point_selection()
     state["window"].destroy()
-    plt.close('all')
     
 def main():
     """Main function to start the GUI application. 
@@ -360,6 +633,12 @@ def main():
     window = guilib.create_window("Spectral Matters Analyzer")
     state["window"] = window
     window.protocol("WM_DELETE_WINDOW", close_app)
+
+    # A single figure and canvas are reused for every plot; the canvas is shown on the first plot
+    figure = Figure()
+    figure.add_subplot()
+    state["canvas"] = FigureCanvasTkAgg(figure, master=window)
+    state["canvas"].mpl_connect("draw_event", cache_background)
     
     frame_left = guilib.create_frame(window)
     guilib.create_button(frame_left, "Load Data", load_data)
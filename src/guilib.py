@@ -14,6 +14,13 @@ information here:
 
 https://docs.python.org/3/library/tk.html
 
+Frames, buttons, labels, textfields, scrollbars and separators are themed ttk
+widgets, which means they look like the rest of the operating system. If you
+want to change their colors, you need to do it with ttk styles instead of
+options like bg:
+
+https://docs.python.org/3/library/tkinter.ttk.html
+
 One of the most notable limitations is that while Tk will take care of most of
 the widget placement (based on which frames they are in), the figure and
 textbox sizes will be defined statically. Their dimensions will therefore
@@ -26,19 +33,81 @@ directions about how to create basic widgets with this library.
 """
 
 import tkinter as tk
-from tkinter.ttk import Separator
+from tkinter import ttk
 from tkinter import messagebox, filedialog
 
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import matplotlib
 matplotlib.use("TkAgg")
+# figures are redrawn often in an interface, so drawing them is made cheaper:
+# lines with lots of points are simplified and drawn in chunks, text isn't
+# hinted and no layout engine runs on every draw
+matplotlib.rcParams.update({
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+    "text.hinting": "none",
+    "figure.autolayout": False,
+})
 
 LEFT = tk.LEFT
 RIGHT = tk.RIGHT
 TOP = tk.TOP
 BOTTOM = tk.BOTTOM
 
+# other Tk constants used by the functions below, bound once at import
+_BOTH = tk.BOTH
+_X = tk.X
+_Y = tk.Y
+_END = tk.END
+_INSERT = tk.INSERT
+_NORMAL = "normal"
+_DISABLED = "disabled"
+
+# message window functions indexed with the error flag of open_msg_window
+_MSGBOX = (messagebox.showinfo, messagebox.showerror)
+
+# figures that have been removed from the interface are kept here for reuse,
+# keyed with (frame, width, height) because Tk widgets can't change parents
+_figure_pool = {}
+# pool key, redraw function and click callback id of each figure in use
+_figures_in_use = {}
+# released subwindows waiting for reuse, at most _SUBWINDOW_POOL_SIZE of them
+_subwindow_pool = []
+_SUBWINDOW_POOL_SIZE = 8
+# dialog objects shared by all calls of the dialog functions
+_folder_dialog = filedialog.Directory(mustexist=True)
+_file_dialog = filedialog.Open()
+_save_dialog = filedialog.SaveAs()
+# ttk style object of the separators, created when the first one is needed
+_style = None
+_SEP_H = "Guilib.Horizontal.TSeparator"
+_SEP_V = "Guilib.Vertical.TSeparator"
+
+class _Ctx:
+    """
+    Holds the main window of the interface so that start and quit can be
+    called without arguments.
+    """
+
+    __slots__ = ("window",)
+
+    def __init__(self):
+        self.window = None
+
+_ctx = _Ctx()
+
+def __getattr__(name):
+    """
+    Keeps guilib.window working for code that used the main window through
+    the module before it was moved into _ctx.
+    """
+
+    if name == "window":
+        return _ctx.window
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
 def create_window(title):
     """
     Creates a window for the user interface. The window is the root for
@@ -49,14 +118,18 @@ def create_window(title):
     :return: returns the created window object
     """
 
-    # we're using a global variable so that start and quit functions can be 
-    # called without arguments
-    global window
+    global _style
     window = tk.Tk()
+    _ctx.window = window
     window.wm_title(title)
+    # widgets and styles created for an earlier window don't exist in this one
+    _figure_pool.clear()
+    _figures_in_use.clear()
+    _subwindow_pool.clear()
+    _style = None
     return window
 
-def create_frame(host, side=LEFT):
+def create_frame(host, side=LEFT, defer_pack=False):
     """
     Creates a frame where other widgets can be placed. Frames can be used to
     divide the interface into segments that are easier to handle. They are also
@@ -72,14 +145,15 @@ def create_frame(host, side=LEFT):
     
     :param widget host: frame or window that will host the frame
     :param str side: which border of the host this frame is packed against
+    :param bool defer_pack: leave placing the frame to commit_layout
     :return: returns the created frame object
     """
 
-    frame = tk.Frame(host)
-    frame.pack(side=side, anchor="n")
+    frame = ttk.Frame(host)
+    _pack(frame, defer_pack, side=side, anchor="n")
     return frame
 
-def create_button(frame, label, handler):
+def create_button(frame, label, handler, defer_pack=False):
     """
     Creates a button that the user can click. Buttons work through handler
     functions. There must be a function in your code that is called whenever
@@ -100,13 +174,108 @@ def create_button(frame, label, handler):
     :param widget frame: frame that will host the buttons
     :param str label: text on the button
     :param function handler: function that is called when the button is pressed
+    :param bool defer_pack: leave placing the button to commit_layout
     :return: returns the created button object
     """
 
-    button = tk.Button(frame, text=label, command=handler)
-    button.pack(side=tk.TOP, fill=tk.BOTH)
+    if handler is None or type(handler).__hash__ is None:
+        button = ttk.Button(frame, text=label, command=handler)
+    else:
+        root = frame._root()
+        name = _use_handler(root, handler)
+        button = ttk.Button(frame, text=label, command=name)
+        # the handler's command is deleted when the last button using it is
+        # destroyed
+        button.bind("<Destroy>", "+{} {}".format(root._release_command, name))
+    _pack(button, defer_pack, side=TOP, fill=_BOTH)
     return button
 
+def _use_handler(root, handler):
+    """
+    Returns the Tcl command name of a button handler, registering the handler
+    if no other button in the same interpreter uses it yet. The names are
+    kept in the root window, because commands only exist in the interpreter
+    that registered them.
+
+    :param widget root: root window of the button
+    :param function handler: button handler
+    :return: Tcl command name of the handler
+    """
+
+    if not hasattr(root, "_handler_commands"):
+        # handler -> name, and name -> [handler, number of buttons using it]
+        root._handler_commands = {}
+        root._handler_users = {}
+        root._release_command = root.register(
+            lambda name: _release_handler(root, name)
+        )
+    # bound methods of different objects are different keys because they
+    # compare equal only if both the function and the object are the same
+    name = root._handler_commands.get(handler)
+    if name is None:
+        name = root.register(handler)
+        root._handler_commands[handler] = name
+        root._handler_users[name] = [handler, 0]
+    root._handler_users[name][1] += 1
+    return name
+
+def _release_handler(root, name):
+    """
+    Called by Tk when a button is destroyed. Deletes the command of the
+    button's handler if no other button uses it anymore.
+
+    :param widget root: root window of the button
+    :param str name: Tcl command name of the handler
+    """
+
+    users = root._handler_users.get(name)
+    if users is None:
+        return
+    users[1] -= 1
+    if users[1] == 0:
+        del root._handler_users[name]
+        del root._handler_commands[users[0]]
+        root.deletecommand(name)
+
+def _pack(widget, defer, **options):
+    """
+    Packs the widget with the given options, or if defer is True, stores the
+    options in the widget so that commit_layout can pack it later.
+
+    :param widget widget: widget to pack
+    :param bool defer: should packing be left to commit_layout
+    """
+
+    if defer:
+        widget._pack_kwargs = options
+    else:
+        widget.pack(**options)
+
+def commit_layout(frame):
+    """
+    Places all widgets that were created into the given frame with the
+    defer_pack option. Every time a widget is packed, Tk needs to work out the
+    layout of its frame again. When a frame gets lots of widgets, it's faster
+    to create them all with defer_pack=True and then call this function once:
+
+    frame = create_frame(window, defer_pack=True)
+    create_label(frame, "Name:", defer_pack=True)
+    create_textfield(frame, defer_pack=True)
+    commit_layout(frame)
+    commit_layout(window)
+
+    The widgets are placed in the same order they were created in. Widgets
+    that were packed already are left as they are.
+
+    :param widget frame: frame (or window) whose widgets are placed
+    """
+
+    for widget in frame.winfo_children():
+        options = getattr(widget, "_pack_kwargs", None)
+        if options is not None:
+            widget.pack(**options)
+            del widget._pack_kwargs
+
 def create_figure(frame, mouse_handler, width, height):
     """
     Creates a figure and a canvas that will contain it. This function can be
@@ -130,19 +299,126 @@ def create_figure(frame, mouse_handler, width, height):
 
     The figure's width and height are given as pixels.
 
+    Redrawing the whole figure with canvas.draw() is slow if it's done often,
+    e.g. in the mouse handler. For things that don't need an immediate update,
+    use canvas.draw_idle() instead, which lets Tk combine several redraws into
+    one. For artists that change all the time (e.g. a marker that follows the
+    clicks), use the returned redraw function. It's given a list of the
+    artists (lines, markers, patches etc.) that have changed, and it only
+    paints those on top of a cached image of the rest of the figure:
+
+    line, = subplot.plot(x, y)
+    redraw([line])
+
+    The artists given to redraw are left out of normal redraws of the figure
+    and are only painted by redraw, so always give it all of them.
+
+    Creating a figure takes a lot of time and memory. If a figure is removed
+    with remove_component (or release_figure), it is kept hidden and reused by
+    the next create_figure call with the same frame and size. The reused
+    figure is cleared and only calls the new mouse handler.
+
     :param widget frame: frame to host the figure
     :param function mouse_handler: function that will be called for clicks
     :param int width: figure width as pixels
     :param int height: figure height as pixels
-    :return: canvas object, figure object, axes object
+    :return: canvas object, figure object, axes object, redraw function
+    """
+
+    key = (frame, width, height)
+    if _figure_pool.get(key):
+        canvas, figure, subplot, redraw = _figure_pool[key].pop()
+        canvas.draw_idle()
+    else:
+        canvas, figure, subplot, redraw = _build_figure(frame, width, height)
+    canvas.get_tk_widget().pack(side=TOP)
+    click_id = canvas.mpl_connect("button_press_event", mouse_handler)
+    _figures_in_use[canvas] = (key, redraw, click_id)
+    return canvas, figure, subplot, redraw
+
+def _build_figure(frame, width, height):
+    """
+    Builds a new figure, its canvas and subplot, and the redraw function for
+    create_figure.
+
+    :param widget frame: frame to host the figure
+    :param int width: figure width as pixels
+    :param int height: figure height as pixels
+    :return: canvas object, figure object, axes object, redraw function
     """
 
     figure = Figure(figsize=(width / 100, height / 100), dpi=100)
     canvas = FigureCanvasTkAgg(figure, master=frame)
-    canvas.get_tk_widget().pack(side=tk.TOP)
-    canvas.mpl_connect("button_press_event", mouse_handler)
     subplot = figure.add_subplot()
-    return canvas, figure, subplot
+    background = None
+    animated = []
+
+    def cache_background(event):
+        # every full redraw (including the ones caused by resizing the window)
+        # refreshes the cached image before the animated artists are painted
+        nonlocal background
+        background = canvas.copy_from_bbox(figure.bbox)
+        for artist in animated:
+            # artists removed from the subplot (e.g. when it was cleared) are skipped
+            if artist.axes is not None:
+                figure.draw_artist(artist)
+
+    def redraw(artists):
+        animated[:] = artists
+        for artist in artists:
+            artist.set_animated(True)
+        if background is None:
+            canvas.draw()
+            return
+        canvas.restore_region(background)
+        for artist in artists:
+            figure.draw_artist(artist)
+        canvas.blit(figure.bbox)
+
+    def forget(event):
+        _forget_figure(canvas, (frame, width, height))
+
+    canvas.mpl_connect("draw_event", cache_background)
+    # a figure whose frame is destroyed without releasing it must not stay in
+    # the pools forever
+    canvas.get_tk_widget().bind("<Destroy>", forget, add="+")
+    return canvas, figure, subplot, redraw
+
+def _forget_figure(canvas, key):
+    """
+    Drops a destroyed figure from the figure pools so that its memory can be
+    freed.
+
+    :param object canvas: canvas of the destroyed figure
+    :param tuple key: pool key of the figure
+    """
+
+    _figures_in_use.pop(canvas, None)
+    pooled = _figure_pool.get(key)
+    if pooled is not None:
+        pooled[:] = [entry for entry in pooled if entry[0] is not canvas]
+        if not pooled:
+            del _figure_pool[key]
+
+def release_figure(canvas, figure, subplot):
+    """
+    Removes a figure made with create_figure from the interface and stores it
+    for reuse. The whole figure is cleared (including e.g. colorbars and
+    titles), it gets a new empty subplot, and the mouse handler is
+    disconnected. The figure objects shouldn't be used after releasing them.
+    remove_component calls this automatically for figure canvases.
+
+    :param object canvas: canvas of the figure
+    :param object figure: the figure
+    :param object subplot: axes of the figure
+    """
+
+    key, redraw, click_id = _figures_in_use.pop(canvas)
+    canvas.mpl_disconnect(click_id)
+    figure.clear()
+    subplot = figure.add_subplot()
+    canvas.get_tk_widget().pack_forget()
+    _figure_pool.setdefault(key, []).append((canvas, figure, subplot, redraw))
 
 def create_textbox(frame, width=80, height=20):
     """
@@ -159,33 +435,71 @@ def create_textbox(frame, width=80, height=20):
     :return: textbox object
     """
 
-    boxframe = create_frame(frame, tk.TOP)
-    scrollbar = tk.Scrollbar(boxframe)
-    box = tk.Text(boxframe, height=height, width=width, yscrollcommand=scrollbar.set)
-    box.configure(state="disabled")
-    box.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
-    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-    scrollbar.configure(command=box.yview)
+    boxframe = create_frame(frame, TOP)
+    box = tk.Text(boxframe, height=height, width=width, state=_DISABLED)
+    _grid_with_scrollbar(boxframe, box)
     return box
 
+def _grid_with_scrollbar(frame, box):
+    """
+    Places a textbox or a listbox into the top left corner of its own frame
+    with a vertical scrollbar next to it. The box takes all the space that the
+    frame gets. The frame must not contain anything else, because grid and
+    pack can't be used in the same frame.
+
+    :param widget frame: frame created for the box
+    :param widget box: textbox or listbox to place
+    """
+
+    scrollbar = ttk.Scrollbar(frame, command=box.yview)
+    box.configure(yscrollcommand=scrollbar.set)
+    box.grid(row=0, column=0, sticky="nsew")
+    scrollbar.grid(row=0, column=1, sticky="ns")
+    frame.grid_rowconfigure(0, weight=1)
+    frame.grid_columnconfigure(0, weight=1)
+
 def write_to_textbox(box, content, clear=False):
     """
     Writes a line of text into the selected textbox. The box can also be
     cleared before writing by setting the optional clear argument to True.
 
+    The text appears when Tk has finished handling the current event. Lines
+    written one after another are combined and inserted into the box in one
+    go, which is a lot faster than inserting them one by one.
+
     :param widget box: textbox object to write to
     :param str content: text to write
     :param bool clear: should the box be cleared first
     """
 
-    box.configure(state="normal")
-    if clear:
+    if clear or not hasattr(box, "_pending"):
+        box._pending = []
+        box._clear_pending = clear
+    box._pending.append(content)
+    if not getattr(box, "_flush_scheduled", False):
+        box._flush_scheduled = True
+        box.after_idle(_flush_textbox, box)
+
+def _flush_textbox(box):
+    """
+    Inserts the lines written with write_to_textbox since the last flush into
+    the textbox and scrolls to the end.
+
+    :param widget box: textbox object to flush
+    """
+
+    box.configure(state=_NORMAL)
+    if box._clear_pending:
         try:
-            box.delete(1.0, tk.END)
+            box.delete(1.0, _END)
         except tk.TclError:
             pass
-    box.insert(tk.INSERT, content + "\n")
-    box.configure(state="disabled")
+    box.insert(_INSERT, "\n".join(box._pending) + "\n")
+    box.configure(state=_DISABLED)
+    box.see(_END)
+    box._pending = []
+    box._clear_pending = False
+    box._flush_scheduled = False
 
 def create_listbox(frame, width=80, height=20):
     """
@@ -193,25 +507,62 @@ def create_listbox(frame, width=80, height=20):
     entities. This means they can be clicked with the mouse, and can be removed
     and inserted individually.
 
+    The listbox keeps a copy of its rows so that read_selected doesn't need to
+    ask Tk for them. Like Tk, the copy stores the rows as strings. Therefore rows should only be added and removed with the
+    functions of this library, otherwise the copy won't match the listbox.
+
     :param widget frame: host frame for the listbox
     :param int width: box width as characters
     :param int height: box height as rows
     :return: listbox object
     """
 
-    boxframe = create_frame(frame, tk.TOP)
-    scrollbar = tk.Scrollbar(boxframe)
-    box = tk.Listbox(boxframe,
-        height=height,
-        width=width,
-        yscrollcommand=scrollbar.set
-    )
-    box.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
-    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-    scrollbar.configure(command=box.yview)
+    boxframe = create_frame(frame, TOP)
+    box = tk.Listbox(boxframe, height=height, width=width)
+    box._rows = []
+    _grid_with_scrollbar(boxframe, box)
     return box
 
-def add_list_row(box, content, place=tk.END):
+def _row_position(box, place):
+    """
+    Converts a listbox index into a position in the listbox's copy of its
+    rows. END and positions past the last row mean the end of the list.
+
+    :param widget box: listbox whose rows are indexed
+    :param place: index as an integer or in any form Tk accepts
+    :return: position as an integer
+    """
+
+    if place == _END:
+        return len(box._rows)
+    if not isinstance(place, int):
+        place = box.index(place)
+    return min(max(place, 0), len(box._rows))
+
+def _forget_rows(box, start, end):
+    """
+    Removes rows from the listbox's copy of its rows the same way Tk removes
+    them from the listbox itself. Both the start and the end row are removed.
+
+    :param widget box: listbox whose rows are removed
+    :param start: index of the first row
+    :param end: index of the last row
+    """
+
+    rows = getattr(box, "_rows", None)
+    if rows is None:
+        return
+    if start == _END:
+        start = len(rows) - 1
+    elif not isinstance(start, int):
+        start = box.index(start)
+    if end == _END:
+        end = len(rows) - 1
+    elif not isinstance(end, int):
+        end = box.index(end)
+    del rows[max(start, 0):max(end + 1, 0)]
+
+def add_list_row(box, content, place=_END):
     """
     Adds a textrow to a listbox. Place can be given as an optional argument
     which inserts the row into the selected spot. If place is not given, the
@@ -222,8 +573,28 @@ def add_list_row(box, content, place=tk.END):
     :param int place: place in the list for insertion (optional)
     """
 
+    if hasattr(box, "_rows"):
+        box._rows.insert(_row_position(box, place), str(content))
     box.insert(place, content)
 
+def add_list_rows(box, contents, place=_END):
+    """
+    Adds several textrows to a listbox at once. Works like add_list_row but
+    all rows are inserted with one call, which is much faster than adding them
+    one by one. Use this e.g. when filling a listbox with data read from a
+    file.
+
+    :param widget box: listbox to add the rows to
+    :param list contents: contents of the rows
+    :param int place: place in the list for insertion (optional)
+    """
+
+    contents = list(contents)
+    if hasattr(box, "_rows"):
+        position = _row_position(box, place)
+        box._rows[position:position] = [str(content) for content in contents]
+    box.insert(place, *contents)
+
 def remove_list_row(box, index):
     """
     Removes the selected row from a listbox. Row is chosen with an index.
@@ -232,8 +603,22 @@ def remove_list_row(box, index):
     :param int index: index of the row
     """
 
+    _forget_rows(box, index, index)
     box.delete(index)
 
+def remove_list_rows(box, start, end):
+    """
+    Removes a range of rows from a listbox with one call. Both the start and
+    the end index are included in the removed rows.
+
+    :param widget box: listbox to remove from
+    :param int start: index of the first row to remove
+    :param int end: index of the last row to remove
+    """
+
+    _forget_rows(box, start, end)
+    box.delete(start, end)
+
 def read_selected(box):
     """
     Reads which row in a listbox has been selected with the mouse. Returns the
@@ -245,45 +630,63 @@ def read_selected(box):
 
     selected = box.curselection()
     if selected:
-        content = box.get(selected)
-        return selected[0], content
+        rows = getattr(box, "_rows", None)
+        if rows is None:
+            return selected[0], box.get(selected)
+        return selected[0], rows[selected[0]]
     return None, None
 
-def create_label(frame, text):
+def create_label(frame, text, defer_pack=False):
     """
     Creates a static label that can be used to display state information or
     give labels to components or frames. 
 
     :param widget frame: frame to host the label
     :param str label: text of the label
+    :param bool defer_pack: leave placing the label to commit_layout
     :return: label object
     """
 
-    label = tk.Label(frame, text=text)
-    label.pack(side=tk.TOP, fill=tk.BOTH)
+    label = ttk.Label(frame, text=text)
+    _pack(label, defer_pack, side=TOP, fill=_BOTH)
     return label
 
 def update_label(label, text):
     """
-    Updates the text of the given label.
+    Updates the text of the given label. Nothing is done if the label already
+    shows the same text, so that Tk doesn't redraw it needlessly.
 
     :param widget label: label to update 
     :param str label: new text
     """
 
-    labal.configure(text=text)
+    if label.cget("text") != text:
+        label.configure(text=text)
 
-def create_textfield(frame):
+def create_textfield(frame, defer_pack=False):
     """
     Creates a textfield where the user can write text. The contents of the
     field can be accessed with the read_field function.
 
+    The field is tied to a Tk string variable that tells the field whenever
+    its contents change. The field keeps a copy of its contents, which makes
+    reading it with read_field fast even if it's done very often.
+
     :param widget frame: frame to host the textfield
+    :param bool defer_pack: leave placing the textfield to commit_layout
     :return: textfield object
     """
 
-    field = tk.Entry(frame)
-    field.pack(side=tk.TOP, fill=tk.BOTH)
+    var = tk.StringVar(frame)
+    field = ttk.Entry(frame, textvariable=var)
+    field._var = var
+    field._cached = ""
+
+    def update_cache(*args):
+        field._cached = var.get()
+
+    var.trace_add("write", update_cache)
+    _pack(field, defer_pack, side=TOP, fill=_BOTH)
     return field
 
 def read_field(field):
@@ -294,7 +697,11 @@ def read_field(field):
     :return: contents as a string
     """
 
-    return field.get()
+    content = getattr(field, "_cached", None)
+    if content is None:
+        # field that wasn't created with create_textfield
+        return field.get()
+    return content
 
 def clear_field(field):
     """
@@ -303,17 +710,20 @@ def clear_field(field):
     :param widget field: textfield to clear
     """
 
-    field.delete(0, len(field.get()))
+    field.delete(0, _END)
 
-def write_field(field, content):
+def write_field(field, content, pos=0):
     """
-    Writes to the selected textfield.
+    Writes to the selected textfield. By default the content is written to the
+    beginning of the field. To add it to the end instead, give tk.END as the
+    optional pos argument.
 
     :param widget field: textfield to write to
     :param str content: content to write
+    :param pos: position in the field where the content is written
     """
 
-    field.insert(0, content)
+    field.insert(pos, content)
 
 def create_horiz_separator(frame, margin=2):
     """
@@ -325,21 +735,39 @@ def create_horiz_separator(frame, margin=2):
     :param int margin: amount of margin as pixels
     """
 
-    separator = Separator(frame, orient="horizontal")
-    separator.pack(side=tk.TOP, fill=tk.BOTH, pady=margin)
+    _init_separator_styles(frame)
+    separator = ttk.Separator(frame, orient="horizontal", style=_SEP_H)
+    separator.pack(side=TOP, fill=_X, pady=margin)
 
 def create_vert_separator(frame, margin=2):
     """
     Creates a vertical separator that can be used e.g. to partition the UI
     more clear. The function's optional argument can be used to adjust how much
-    margin is left on both sides of the separator.
+    margin is left on both sides of the separator. The separator is packed
+    against the left border of its frame so that it runs from the top of the
+    frame to the bottom, between the components on its both sides.
 
     :param widget frame: frame to host the separator
     :param int margin: amount of margin as pixels
     """
 
-    separator = Separator(frame, orient="vertical")
-    separator.pack(side=tk.TOP, fill=tk.BOTH, pady=margin)
+    _init_separator_styles(frame)
+    separator = ttk.Separator(frame, orient="vertical", style=_SEP_V)
+    separator.pack(side=LEFT, fill=_Y, padx=margin)
+
+def _init_separator_styles(frame):
+    """
+    Sets up the ttk styles used by the separators the first time a separator
+    is created. Later calls do nothing.
+
+    :param widget frame: any widget of the interface
+    """
+
+    global _style
+    if _style is None:
+        _style = ttk.Style(frame)
+        _style.configure(_SEP_H)
+        _style.configure(_SEP_V)
 
 def open_msg_window(title, message, error=False):
     """
@@ -353,10 +781,7 @@ def open_msg_window(title, message, error=False):
     :param bool error: determines window type (info or error)
     """
 
-    if error:
-        messagebox.showerror(title, message)
-    else:
-        messagebox.showinfo(title, message)
+    _MSGBOX[bool(error)](title, message)
 
 def open_folder_dialog(title, initial="."):
     """
@@ -371,8 +796,7 @@ def open_folder_dialog(title, initial="."):
     :return: path of the chosen folder
     """
 
-    path = filedialog.askdirectory(title=title, mustexist=True, initialdir=initial)
-    return path
+    return _show_dialog(_folder_dialog, title, initialdir=initial)
 
 def open_file_dialog(title, initial="."):
     """
@@ -386,8 +810,7 @@ def open_file_dialog(title, initial="."):
     :return: path of the chosen file
     """
 
-    path = filedialog.askopenfilename(title=title, initialdir=initial)
-    return path
+    return _show_dialog(_file_dialog, title, initialdir=initial, initialfile="")
 
 def open_save_dialog(title, initial="."):
     """
@@ -402,20 +825,40 @@ def open_save_dialog(title, initial="."):
     :return: path of the chosen file
     """
 
-    path = filedialog.asksaveasfilename(title=title, initialdir=initial)
-    return path
+    return _show_dialog(_save_dialog, title, initialdir=initial, initialfile="")
+
+def _show_dialog(dialog, title, **options):
+    """
+    Shows one of the shared dialog objects with the given title and options.
+    Tk remembers the file chosen last time in the dialog's options, which is
+    why the file dialogs are given an empty initialfile every time.
+
+    :param object dialog: dialog object to show
+    :param str title: dialog title
+    :return: path chosen by the user, or an empty string if it was cancelled
+    """
+
+    dialog.options["title"] = title
+    return dialog.show(**options) or ""
 
 def remove_component(component):
     """
     Removes a component from the inteface. Needed for temporary widgets.
+    Figure canvases made with create_figure are hidden and kept for reuse
+    instead of being destroyed.
 
     :param widget component: component to remove
     """
 
-    try:
-        component.destroy()
-    except AttributeError:
+    if component in _figures_in_use:
+        release_figure(component, component.figure, component.figure.axes[0])
+        return
+    # matplotlib canvases have no destroy method, only their Tk widget does
+    destroy = getattr(component, "destroy", None)
+    if destroy is None:
         component.get_tk_widget().destroy()
+    else:
+        destroy()
 
 def create_subwindow(title):
     """
@@ -424,15 +867,52 @@ def create_subwindow(title):
     be hidden and showed again with the show_subwindow and hide_subwindow
     functions. The subwindow will also hide itself if the user closes it.
 
+    Creating windows is slow, so subwindows that are no longer needed should be
+    given to release_subwindow. This function reuses them before creating new
+    ones.
+
     :param str title: subwindow title
     :return: created subwindow object
     """
 
-    sub = tk.Toplevel()
-    sub.title(title)
-    sub.protocol("WM_DELETE_WINDOW", sub.withdraw)
+    if _subwindow_pool:
+        sub = _subwindow_pool.pop()
+        # settings made by the previous user of the window are undone, and
+        # the original close command is put back by name so that no new Tcl
+        # command is registered
+        for sequence in sub.bind():
+            sub.unbind(sequence)
+        sub.geometry("")
+        if str(sub.protocol("WM_DELETE_WINDOW")) != sub._withdraw_command:
+            sub.protocol("WM_DELETE_WINDOW", sub._withdraw_command)
+        sub.title(title)
+        sub.deiconify()
+    else:
+        sub = tk.Toplevel()
+        sub.protocol("WM_DELETE_WINDOW", sub.withdraw)
+        sub._withdraw_command = str(sub.protocol("WM_DELETE_WINDOW"))
+        sub.title(title)
     return sub
 
+def release_subwindow(sub):
+    """
+    Hides a subwindow that is no longer needed and stores it for reuse by
+    create_subwindow. All components inside the subwindow are destroyed, so
+    unlike a hidden subwindow it can't be shown again.
+
+    :param object sub: subwindow to release
+    """
+
+    sub.withdraw()
+    # figures inside the subwindow drop themselves from the figure pools when
+    # they are destroyed here
+    for child in sub.winfo_children():
+        child.destroy()
+    if len(_subwindow_pool) < _SUBWINDOW_POOL_SIZE:
+        _subwindow_pool.append(sub)
+    else:
+        sub.destroy()
+
 def show_subwindow(sub, title=None):
     """
     Shows the selected subwindow.
@@ -458,14 +938,15 @@ def start():
     Starts the program. Call this once your interface setup is done.
     """
 
-    window.mainloop()
+    _ctx.window.mainloop()
 
 def quit():
     """
     Exits the program and closes the window.
     """
 
-    window.destroy()
+    _ctx.window.destroy()
+    _ctx.window = None
 
 if __name__ == "__main__":
     # Disabling two pylint warnings because it would complain about the test
@@ -493,9 +974,11 @@ if __name__ == "__main__":
     inputframe = create_frame(topframe, LEFT)
     greetbutton = create_button(buttonframe, "greet", greet)
     quitbutton = create_button(buttonframe, "quit", quit)
-    namelabel = create_label(inputframe, "Nimi:")
-    namefield = create_textfield(inputframe)
-    joblabel = create_label(inputframe, "Ammatti:")
-    jobfield = create_textfield(inputframe)
+    # the input widgets are created first and placed all at once
+    namelabel = create_label(inputframe, "Nimi:", defer_pack=True)
+    namefield = create_textfield(inputframe, defer_pack=True)
+    joblabel = create_label(inputframe, "Ammatti:", defer_pack=True)
+    jobfield = create_textfield(inputframe, defer_pack=True)
+    commit_layout(inputframe)
     labelbox = create_textbox(bottomframe, 34, 20)
     start()